@@ -14,13 +14,22 @@ Features:
 - Auto-generated API documentation (Swagger UI)
 """
 
-from fastapi import FastAPI, HTTPException, Query, status
+from fastapi import Body, FastAPI, HTTPException, Query, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
-import uuid
+from bisect import bisect_right
+from collections import OrderedDict
+import os
+import time
+
+import msgspec
+import numpy as np
+import orjson
 
 
 # ENUMS & MODELS
@@ -81,7 +90,7 @@ class TaskUpdate(BaseModel):
 
 
 class Task(BaseModel):
-    """Complete task model with all fields"""
+    """Complete task model with all fields (API schema)"""
     id: str = Field(..., description="Unique task identifier")
     title: str
     description: Optional[str] = None
@@ -92,6 +101,22 @@ class Task(BaseModel):
     updated_at: datetime
 
 
+class TaskRecord(msgspec.Struct, gc=False):
+    """
+    Stored task fields, in Task schema order
+
+    A msgspec Struct is much cheaper to construct, copy and encode than a
+    Pydantic model. Input is validated by TaskCreate/TaskUpdate first.
+    created_at/updated_at live in the task table as epoch nanoseconds.
+    """
+    id: str
+    title: str
+    description: Optional[str]
+    status: TaskStatus
+    priority: TaskPriority
+    due_date: Optional[datetime]
+
+
 class TaskResponse(BaseModel):
     """Standard response wrapper for single task"""
     success: bool = True
@@ -106,6 +131,13 @@ class TaskListResponse(BaseModel):
     data: List[Task]
 
 
+class TaskBulkResponse(BaseModel):
+    """Response wrapper for bulk task creation"""
+    success: bool = True
+    count: int
+    ids: List[str]
+
+
 class ErrorResponse(BaseModel):
     """Error response model"""
     success: bool = False
@@ -148,23 +180,370 @@ No rate limiting in demo mode
     license_info={
         "name": "MIT License",
         "url": "https://opensource.org/licenses/MIT"
-    }
+    },
+    default_response_class=ORJSONResponse
 )
 
+# CORS settings, shared by CORSMiddleware and the fast path
+CORS_ALLOW_ORIGINS = ["*"]
+CORS_ALLOW_CREDENTIALS = True
+
+
+class FastPathMiddleware:
+    """
+    Pure ASGI middleware answering GET / and GET /api/health directly
+
+    These are the highest-volume requests (liveness probes), so they skip
+    the rest of the middleware stack and FastAPI routing entirely and are
+    answered with pre-serialized bytes.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["method"] == "GET":
+            path = scope["path"]
+            if path == "/api/health":
+                body = _health_body()
+            elif path == "/":
+                body = ROOT_BODY
+            else:
+                body = None
+            
+            if body is not None:
+                await send({
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": self._headers(scope, body),
+                })
+                await send({"type": "http.response.body", "body": body})
+                return
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    def _headers(scope, body: bytes) -> list[tuple[bytes, bytes]]:
+        """
+        Response headers, with CORS headers built the way CORSMiddleware does
+
+        Uses the same CORS_ALLOW_ORIGINS/CORS_ALLOW_CREDENTIALS settings. With
+        wildcard origins the origin is echoed only for requests carrying a
+        cookie; otherwise only listed origins are echoed.
+        """
+        headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", b"%d" % len(body)),
+        ]
+        origin = None
+        has_cookie = False
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"cookie":
+                has_cookie = True
+        if origin is None:
+            return headers
+        
+        if CORS_ALLOW_CREDENTIALS:
+            headers.append((b"access-control-allow-credentials", b"true"))
+        if "*" in CORS_ALLOW_ORIGINS:
+            if has_cookie:
+                headers += [(b"access-control-allow-origin", origin), (b"vary", b"Origin")]
+            else:
+                headers.append((b"access-control-allow-origin", b"*"))
+        elif origin.decode("latin-1") in CORS_ALLOW_ORIGINS:
+            headers += [(b"access-control-allow-origin", origin), (b"vary", b"Origin")]
+        return headers
+
+
 # CORS Middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=CORS_ALLOW_ORIGINS,
+    allow_credentials=CORS_ALLOW_CREDENTIALS,
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["content-type"],
 )
 
+# Compress larger responses (task lists, stats)
+app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=5)
+
+# Added last so it runs first, ahead of CORS
+app.add_middleware(FastPathMiddleware)
+
 
 # IN-MEMORY DATABASE (Demo purposes)
 
 
-tasks_db: dict[str, Task] = {}
+tasks_db: dict[str, TaskRecord] = {}
+
+# Enum -> int8 codes for the table columns
+STATUS_CODES = {s: i for i, s in enumerate(TaskStatus)}
+PRIORITY_CODES = {p: i for i, p in enumerate(TaskPriority)}
+
+
+class TaskTable:
+    """
+    Struct-of-arrays columns for the task fields that get scanned
+
+    Row i holds the task whose ID is ids[i]; rows stay in insertion order.
+    Status and priority are int8 codes in numpy arrays, so filters and
+    counts are single vectorized passes instead of per-object attribute
+    access. Server-side timestamps are int64 epoch nanoseconds. Deleted
+    rows are tombstoned and compacted once they make up half the table.
+    """
+
+    DELETED = -1
+
+    def __init__(self, capacity: int = 1024):
+        self.ids: list[Optional[str]] = []
+        self.row_of_id: dict[str, int] = {}
+        self.statuses = np.empty(capacity, dtype=np.int8)
+        self.priorities = np.empty(capacity, dtype=np.int8)
+        self.created_ns = np.empty(capacity, dtype=np.int64)
+        self.updated_ns = np.empty(capacity, dtype=np.int64)
+        self.deleted = 0
+
+    def _grow(self):
+        for name in ("statuses", "priorities", "created_ns", "updated_ns"):
+            column = getattr(self, name)
+            setattr(self, name, np.concatenate([column, np.empty_like(column)]))
+
+    def append(self, task: TaskRecord, created_ns: int, updated_ns: int):
+        """Add a row for a new task"""
+        if task.id in self.row_of_id:
+            raise ValueError(f"Task ID '{task.id}' already has a row")
+        row = len(self.ids)
+        if row == len(self.statuses):
+            self._grow()
+        self.ids.append(task.id)
+        self.row_of_id[task.id] = row
+        self.statuses[row] = STATUS_CODES[task.status]
+        self.priorities[row] = PRIORITY_CODES[task.priority]
+        self.created_ns[row] = created_ns
+        self.updated_ns[row] = updated_ns
+
+    def update(self, task: TaskRecord, updated_ns: int):
+        """Refresh the columns of an existing row"""
+        row = self.row_of_id[task.id]
+        self.statuses[row] = STATUS_CODES[task.status]
+        self.priorities[row] = PRIORITY_CODES[task.priority]
+        self.updated_ns[row] = updated_ns
+
+    def timestamps(self, task_id: str) -> tuple[int, int]:
+        """Return (created_ns, updated_ns) for a task"""
+        row = self.row_of_id[task_id]
+        return int(self.created_ns[row]), int(self.updated_ns[row])
+
+    def remove(self, task_id: str):
+        """Tombstone a task's row"""
+        row = self.row_of_id.pop(task_id)
+        self.ids[row] = None
+        self.statuses[row] = self.DELETED
+        self.priorities[row] = self.DELETED
+        self.deleted += 1
+        if self.deleted * 2 > len(self.ids):
+            self._compact()
+
+    def _compact(self):
+        n = len(self.ids)
+        keep = np.flatnonzero(self.statuses[:n] != self.DELETED)
+        for column in (self.statuses, self.priorities, self.created_ns, self.updated_ns):
+            column[:len(keep)] = column[keep]
+        self.ids = [self.ids[row] for row in keep.tolist()]
+        self.row_of_id = {task_id: row for row, task_id in enumerate(self.ids)}
+        self.deleted = 0
+
+    def live_rows(self):
+        """Rows of all existing tasks, in insertion order"""
+        n = len(self.ids)
+        if not self.deleted:
+            return range(n)
+        return np.flatnonzero(self.statuses[:n] != self.DELETED)
+
+    def filter_mask(self, status: Optional[TaskStatus],
+                    priority: Optional[TaskPriority]) -> np.ndarray:
+        """Boolean mask over rows matching the given status/priority"""
+        n = len(self.ids)
+        if status is not None and priority is not None:
+            return ((self.statuses[:n] == STATUS_CODES[status]) &
+                    (self.priorities[:n] == PRIORITY_CODES[priority]))
+        if status is not None:
+            return self.statuses[:n] == STATUS_CODES[status]
+        return self.priorities[:n] == PRIORITY_CODES[priority]
+
+    def counts(self, column: np.ndarray, size: int) -> list[int]:
+        """Count live rows per code in a column"""
+        # Shift by one so tombstones land in bucket 0, which is dropped
+        return np.bincount(column[:len(self.ids)] + 1, minlength=size + 1)[1:].tolist()
+
+
+task_table = TaskTable()
+
+# Lowercased (title, description) per task for case-insensitive search
+search_cache: dict[str, tuple[str, str]] = {}
+
+
+class TaskSearchIndex:
+    """
+    Substring search over every task's lowercased title/description
+
+    All texts are joined into one NUL-separated string, so a query runs as
+    a few C-level str.find calls rather than a Python loop over every task.
+    The string is rebuilt lazily on the first search after a change.
+    """
+
+    def __init__(self):
+        self._text = ""
+        self._starts: list[int] = []
+        self._rows: list[int] = []
+        self._stale = True
+
+    def invalidate(self):
+        """Mark the index as needing a rebuild"""
+        self._stale = True
+
+    def _rebuild(self):
+        chunks = []
+        starts = []
+        rows = []
+        pos = 0
+        for row, task_id in enumerate(task_table.ids):
+            if task_id is None:
+                continue
+            title, description = search_cache[task_id]
+            chunk = f"{title}\0{description}\0"
+            starts.append(pos)
+            chunks.append(chunk)
+            rows.append(row)
+            pos += len(chunk)
+        self._text = "".join(chunks)
+        self._starts = starts
+        self._rows = rows
+        self._stale = False
+
+    def find(self, needle: str, row_mask: Optional[np.ndarray] = None,
+             stop: Optional[int] = None) -> list[int]:
+        """
+        Return task_table rows containing the lowercased needle, in order
+
+        Rows outside row_mask are skipped, and the scan ends as soon as
+        stop rows have matched.
+        """
+        if self._stale:
+            self._rebuild()
+        # NUL separates fields, so it can never be part of a match
+        if "\0" in needle:
+            return []
+        
+        text_find = self._text.find
+        starts = self._starts
+        rows = self._rows
+        matches = []
+        pos = text_find(needle)
+        while pos != -1:
+            i = bisect_right(starts, pos) - 1
+            if row_mask is None or row_mask[rows[i]]:
+                matches.append(rows[i])
+                if len(matches) == stop:
+                    break
+            if i + 1 == len(starts):
+                break
+            # Resume at the next task; one hit per task is enough
+            pos = text_find(needle, starts[i + 1])
+        return matches
+
+
+search_index = TaskSearchIndex()
+
+# Serialized JSON body per task, spliced into responses
+task_json: dict[str, bytes] = {}
+_json_encoder = msgspec.json.Encoder()
+
+# Serialized GET /api/tasks bodies keyed by query; cleared on any mutation
+query_cache: OrderedDict[tuple, bytes] = OrderedDict()
+QUERY_CACHE_SIZE = 1024
+
+
+# Random bytes for task IDs, refilled 4 KB at a time
+_id_pool = bytearray()
+_id_pool_pos = 0
+
+
+def _random_task_id() -> str:
+    """Slice the next 4 random bytes from the pool into a task ID"""
+    global _id_pool_pos
+    if _id_pool_pos >= len(_id_pool):
+        _id_pool[:] = os.urandom(4096)
+        _id_pool_pos = 0
+    chunk = _id_pool[_id_pool_pos:_id_pool_pos + 4]
+    _id_pool_pos += 4
+    return f"task-{chunk.hex()}"
+
+
+def _new_task_id() -> str:
+    """Generate an unused task ID from the pre-filled random byte pool"""
+    # IDs carry only 32 random bits, so repeats do happen at scale
+    while (task_id := _random_task_id()) in tasks_db:
+        pass
+    return task_id
+
+
+def _cache_search_text(task: TaskRecord):
+    """Store the lowercased title/description used by search"""
+    search_cache[task.id] = (task.title.lower(), (task.description or "").lower())
+    search_index.invalidate()
+
+
+def _to_ns(dt: datetime) -> int:
+    """Convert a naive local datetime to epoch nanoseconds"""
+    return int(time.mktime(dt.timetuple())) * 1_000_000_000 + dt.microsecond * 1000
+
+
+def _format_ns(ns: int) -> bytes:
+    """Format epoch nanoseconds like naive datetime.isoformat(), without a datetime"""
+    seconds, nanos = divmod(ns, 1_000_000_000)
+    stamp = b"%04d-%02d-%02dT%02d:%02d:%02d" % time.localtime(seconds)[:6]
+    micros = nanos // 1000
+    if micros:
+        stamp += b".%06d" % micros
+    return stamp
+
+
+def _cache_task_json(task: TaskRecord):
+    """Store the serialized JSON body of a task"""
+    created_ns, updated_ns = task_table.timestamps(task.id)
+    # Timestamps are the last Task fields, so append them to the encoded record
+    task_json[task.id] = b'%b,"created_at":"%b","updated_at":"%b"}' % (
+        _json_encoder.encode(task)[:-1], _format_ns(created_ns), _format_ns(updated_ns)
+    )
+
+
+def _task_response(task_id: str, message: str, status_code: int = 200):
+    """Build a TaskResponse body from the cached task JSON"""
+    body = b'{"success":true,"message":%b,"data":%b}' % (
+        orjson.dumps(message), task_json[task_id]
+    )
+    return Response(body, status_code=status_code, media_type="application/json")
+
+
+def _insert_task(task: TaskCreate, now_ns: int) -> TaskRecord:
+    """Store a validated new task and fill its per-task caches"""
+    new_task = TaskRecord(
+        id=_new_task_id(),
+        title=task.title,
+        description=task.description,
+        status=task.status,
+        priority=task.priority,
+        due_date=task.due_date
+    )
+    
+    tasks_db[new_task.id] = new_task
+    task_table.append(new_task, now_ns, now_ns)
+    _cache_search_text(new_task)
+    _cache_task_json(new_task)
+    return new_task
+
 
 # Add sample data
 sample_tasks = [
@@ -201,24 +580,34 @@ sample_tasks = [
 ]
 
 for task_data in sample_tasks:
-    tasks_db[task_data["id"]] = Task(**task_data)
+    task_data = dict(task_data)
+    created_at = task_data.pop("created_at")
+    updated_at = task_data.pop("updated_at")
+    sample = TaskRecord(**task_data)
+    tasks_db[sample.id] = sample
+    task_table.append(sample, _to_ns(created_at), _to_ns(updated_at))
+    _cache_search_text(sample)
+    _cache_task_json(sample)
 
 
 
 # API ENDPOINTS
 
 
+ROOT_BODY = orjson.dumps({
+    "message": "Welcome to Task Management API",
+    "version": "1.0.0",
+    "docs": "/docs",
+    "redoc": "/redoc"
+})
+
+
 @app.get("/", tags=["Root"])
 async def root():
     """
     Root endpoint - API welcome message
     """
-    return {
-        "message": "Welcome to Task Management API",
-        "version": "1.0.0",
-        "docs": "/docs",
-        "redoc": "/redoc"
-    }
+    return Response(ROOT_BODY, media_type="application/json")
 
 
 @app.get("/api/health", tags=["Health"])
@@ -228,22 +617,42 @@ async def health_check():
     
     Returns the API status and current timestamp.
     Useful for load balancers and monitoring systems.
+    
+    Requests are normally answered by FastPathMiddleware; this route
+    documents the endpoint in the OpenAPI schema.
     """
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "version": "1.0.0",
-        "total_tasks": len(tasks_db)
-    }
+    return Response(_health_body(), media_type="application/json")
+
+
+# Health check timestamp as [epoch second, ISO bytes of that whole second]
+_health_clock = [-1, b""]
+
+
+def _health_timestamp() -> bytes:
+    """Return the current local time as ISO bytes, truncated to the second"""
+    now_ns = time.time_ns()
+    second = now_ns // 1_000_000_000
+    if second != _health_clock[0]:
+        _health_clock[:] = [second, _format_ns(second * 1_000_000_000)]
+    return _health_clock[1]
+
+
+def _health_body() -> bytes:
+    """Render the health check response body"""
+    return b'{"status":"healthy","timestamp":"%b","version":"1.0.0","total_tasks":%d}' % (
+        _health_timestamp(), len(tasks_db)
+    )
 
 
 # ---------- TASK ENDPOINTS ----------
 
 @app.get(
     "/api/tasks",
-    response_model=TaskListResponse,
     tags=["Tasks"],
-    summary="Get all tasks"
+    summary="Get all tasks",
+    responses={
+        200: {"model": TaskListResponse}
+    }
 )
 async def get_tasks(
     status: Optional[TaskStatus] = Query(None, description="Filter by status"),
@@ -265,39 +674,49 @@ async def get_tasks(
     ### Response:
     Returns a list of tasks matching the criteria
     """
-    filtered_tasks = list(tasks_db.values())
-    
-    # Apply filters
-    if status:
-        filtered_tasks = [t for t in filtered_tasks if t.status == status]
+    search_lower = search.lower() if search else None
+    cache_key = (status, priority, search_lower, limit, offset)
+    body = query_cache.get(cache_key)
+    if body is not None:
+        query_cache.move_to_end(cache_key)
+        return Response(body, media_type="application/json")
     
-    if priority:
-        filtered_tasks = [t for t in filtered_tasks if t.priority == priority]
+    # Status/priority filters are one vectorized pass over the table
+    if status is None and priority is None:
+        mask = None
+    else:
+        mask = task_table.filter_mask(status, priority)
     
-    if search:
-        search_lower = search.lower()
-        filtered_tasks = [
-            t for t in filtered_tasks 
-            if search_lower in t.title.lower() or 
-               (t.description and search_lower in t.description.lower())
-        ]
+    # Rows come back in insertion order from every branch
+    if search_lower:
+        # Apply the filters and stop at the end of the page in the same scan
+        rows = search_index.find(search_lower, mask, offset + limit)
+    elif mask is None:
+        rows = task_table.live_rows()
+    else:
+        rows = np.flatnonzero(mask)
     
     # Apply pagination
-    paginated_tasks = filtered_tasks[offset:offset + limit]
+    page_rows = rows[offset:offset + limit]
     
-    return TaskListResponse(
-        success=True,
-        count=len(paginated_tasks),
-        data=paginated_tasks
+    # Splice the cached task JSON instead of re-serializing each task
+    ids = task_table.ids
+    body = b'{"success":true,"count":%d,"data":[%b]}' % (
+        len(page_rows), b",".join([task_json[ids[row]] for row in page_rows])
     )
+    
+    query_cache[cache_key] = body
+    if len(query_cache) > QUERY_CACHE_SIZE:
+        query_cache.popitem(last=False)
+    return Response(body, media_type="application/json")
 
 
 @app.get(
     "/api/tasks/{task_id}",
-    response_model=TaskResponse,
     tags=["Tasks"],
     summary="Get a specific task",
     responses={
+        200: {"model": TaskResponse},
         404: {"model": ErrorResponse, "description": "Task not found"}
     }
 )
@@ -317,20 +736,16 @@ async def get_task(task_id: str):
             detail=f"Task with ID '{task_id}' not found"
         )
     
-    return TaskResponse(
-        success=True,
-        message="Task retrieved successfully",
-        data=tasks_db[task_id]
-    )
+    return _task_response(task_id, "Task retrieved successfully")
 
 
 @app.post(
     "/api/tasks",
-    response_model=TaskResponse,
     status_code=status.HTTP_201_CREATED,
     tags=["Tasks"],
     summary="Create a new task",
     responses={
+        201: {"model": TaskResponse},
         400: {"model": ErrorResponse, "description": "Validation error"}
     }
 )
@@ -348,35 +763,52 @@ async def create_task(task: TaskCreate):
     ### Response:
     Returns the created task with generated ID and timestamps
     """
-    now = datetime.now()
-    task_id = f"task-{uuid.uuid4().hex[:8]}"
+    new_task = _insert_task(task, time.time_ns())
+    query_cache.clear()
     
-    new_task = Task(
-        id=task_id,
-        title=task.title,
-        description=task.description,
-        status=task.status,
-        priority=task.priority,
-        due_date=task.due_date,
-        created_at=now,
-        updated_at=now
+    return _task_response(
+        new_task.id, "Task created successfully", status.HTTP_201_CREATED
     )
+
+
+@app.post(
+    "/api/tasks/bulk",
+    status_code=status.HTTP_201_CREATED,
+    tags=["Tasks"],
+    summary="Create many tasks at once",
+    responses={
+        201: {"model": TaskBulkResponse}
+    }
+)
+async def create_tasks_bulk(
+    tasks: List[TaskCreate] = Body(..., min_length=1, max_length=1000)
+):
+    """
+    Create several tasks in one request
+    
+    ### Request Body:
+    A list of 1-1000 tasks, each with the same fields as **POST /api/tasks**.
+    The whole list is validated before any task is stored.
     
-    tasks_db[task_id] = new_task
+    ### Response:
+    Returns the generated IDs, in request order
+    """
+    now_ns = time.time_ns()
+    ids = [_insert_task(task, now_ns).id for task in tasks]
+    query_cache.clear()
     
-    return TaskResponse(
-        success=True,
-        message="Task created successfully",
-        data=new_task
+    return ORJSONResponse(
+        {"success": True, "count": len(ids), "ids": ids},
+        status_code=status.HTTP_201_CREATED
     )
 
 
 @app.put(
     "/api/tasks/{task_id}",
-    response_model=TaskResponse,
     tags=["Tasks"],
     summary="Update an existing task",
     responses={
+        200: {"model": TaskResponse},
         404: {"model": ErrorResponse, "description": "Task not found"}
     }
 )
@@ -407,18 +839,25 @@ async def update_task(task_id: str, task_update: TaskUpdate):
     existing_task = tasks_db[task_id]
     update_data = task_update.model_dump(exclude_unset=True)
     
+    # Explicit nulls only clear optional fields
+    for field in ("title", "status", "priority"):
+        if update_data.get(field, "") is None:
+            del update_data[field]
+    
     # Update only provided fields
-    updated_task = existing_task.model_copy(
-        update={**update_data, "updated_at": datetime.now()}
-    )
+    updated_task = msgspec.structs.replace(existing_task, **update_data)
     
     tasks_db[task_id] = updated_task
+    task_table.update(updated_task, time.time_ns())
     
-    return TaskResponse(
-        success=True,
-        message="Task updated successfully",
-        data=updated_task
-    )
+    if (updated_task.title != existing_task.title or
+            updated_task.description != existing_task.description):
+        _cache_search_text(updated_task)
+    
+    _cache_task_json(updated_task)
+    query_cache.clear()
+    
+    return _task_response(task_id, "Task updated successfully")
 
 
 @app.delete(
@@ -446,6 +885,11 @@ async def delete_task(task_id: str):
         )
     
     deleted_task = tasks_db.pop(task_id)
+    task_table.remove(task_id)
+    del search_cache[task_id]
+    search_index.invalidate()
+    del task_json[task_id]
+    query_cache.clear()
     
     return {
         "success": True,
@@ -464,21 +908,20 @@ async def get_statistics():
     
     Returns counts grouped by status and priority
     """
-    tasks = list(tasks_db.values())
-    
-    status_counts = {}
-    for s in TaskStatus:
-        status_counts[s.value] = len([t for t in tasks if t.status == s])
-    
-    priority_counts = {}
-    for p in TaskPriority:
-        priority_counts[p.value] = len([t for t in tasks if t.priority == p])
+    status_counts = dict(zip(
+        [s.value for s in TaskStatus],
+        task_table.counts(task_table.statuses, len(TaskStatus))
+    ))
+    priority_counts = dict(zip(
+        [p.value for p in TaskPriority],
+        task_table.counts(task_table.priorities, len(TaskPriority))
+    ))
     
-    return {
-        "total_tasks": len(tasks),
+    return ORJSONResponse({
+        "total_tasks": len(tasks_db),
         "by_status": status_counts,
         "by_priority": priority_counts
-    }
+    })
 
 
 
@@ -487,5 +930,16 @@ async def get_statistics():
 
 if __name__ == "__main__":
     import uvicorn
-    # Use string import path for reload to work properly
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    debug = os.getenv("DEBUG", "").lower() in ("1", "true", "yes")
+    # Tasks live in process memory, so every worker would hold its own copy;
+    # only raise WORKERS once storage moves to a shared backend
+    workers = 1 if debug else int(os.getenv("WORKERS", "1"))
+    # Use string import path for reload and workers to work properly
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=debug,
+        workers=workers,
+        access_log=debug
+    )
@@ -0,0 +1,28 @@
+"""
+Optional Cython build for the Task Management API
+==================================================
+Compiles app/main.py into a C extension, which Python imports in place
+of the .py module. The source stays plain Python and runs unchanged
+when not compiled.
+
+Build with: python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+
+setup(
+    name="task-management-api",
+    ext_modules=cythonize(
+        ["app/main.py"],
+        compiler_directives={
+            "language_level": "3",
+            "boundscheck": False,
+            # FastAPI/Pydantic read signatures and annotations at runtime,
+            # so keep Python semantics for annotations and function objects
+            "annotation_typing": False,
+            "binding": True,
+        },
+    ),
+)
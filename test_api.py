@@ -54,6 +54,60 @@ class TestHealthEndpoints:
         assert "timestamp" in data
         assert "version" in data
 
+    def test_health_check_task_count(self, client):
+        """Test health check reports the current number of tasks"""
+        response = client.get("/api/health")
+        assert response.headers["content-type"] == "application/json"
+        total = client.get("/api/stats").json()["total_tasks"]
+        assert response.json()["total_tasks"] == total
+
+    def test_health_check_cors_credentials(self, client):
+        """Test health check echoes the origin for credentialed CORS requests"""
+        response = client.get("/api/health", headers={
+            "Origin": "https://dashboard.example.com",
+            "Cookie": "session=abc"
+        })
+        assert response.headers["access-control-allow-origin"] == "https://dashboard.example.com"
+        assert response.headers["access-control-allow-credentials"] == "true"
+        assert response.headers["vary"] == "Origin"
+
+        response = client.get("/api/health")
+        assert "access-control-allow-origin" not in response.headers
+
+    def test_health_check_cors_without_cookie(self, client):
+        """Test health check answers wildcard for cookie-less CORS requests"""
+        headers = {"Origin": "https://dashboard.example.com"}
+        health = client.get("/api/health", headers=headers).headers
+        routed = client.get("/api/stats", headers=headers).headers
+        assert health["access-control-allow-origin"] == "*"
+        assert "vary" not in health
+        for name in ("access-control-allow-origin", "access-control-allow-credentials"):
+            assert health[name] == routed[name]
+
+    def test_health_check_cors_origin_allow_list(self, client, monkeypatch):
+        """Test health check only echoes origins on the CORS allow-list"""
+        import app.main as main
+        monkeypatch.setattr(main, "CORS_ALLOW_ORIGINS", ["https://dashboard.example.com"])
+
+        response = client.get("/api/health", headers={"Origin": "https://dashboard.example.com"})
+        assert response.headers["access-control-allow-origin"] == "https://dashboard.example.com"
+        assert response.headers["vary"] == "Origin"
+
+        response = client.get("/api/health", headers={
+            "Origin": "https://evil.example.com",
+            "Cookie": "session=abc"
+        })
+        assert "access-control-allow-origin" not in response.headers
+
+    def test_root_cors_matches_routed_endpoints(self, client):
+        """Test the root fast path sends the same CORS headers as CORSMiddleware"""
+        origin = {"Origin": "https://dashboard.example.com"}
+        for headers in (origin, {**origin, "Cookie": "session=abc"}):
+            root = client.get("/", headers=headers).headers
+            routed = client.get("/api/stats", headers=headers).headers
+            for name in ("access-control-allow-origin",
+                         "access-control-allow-credentials", "vary"):
+                assert root.get(name) == routed.get(name)
 
 
 # GET TASKS TESTS
@@ -97,6 +151,51 @@ class TestGetTasks:
             assert "api" in task["title"].lower() or \
                    (task["description"] and "api" in task["description"].lower())
 
+    def test_get_tasks_search_fields(self, client):
+        """Test search matches title or description, not across them"""
+        create_response = client.post("/api/tasks", json={
+            "title": "Quarterly Zebra Report",
+            "description": "Gather Okapi metrics",
+            "status": "cancelled"
+        })
+        task_id = create_response.json()["data"]["id"]
+
+        def search_ids(query):
+            response = client.get(f"/api/tasks?{query}")
+            return [t["id"] for t in response.json()["data"]]
+
+        assert task_id in search_ids("search=zebra")
+        assert task_id in search_ids("search=OKAPI")
+        assert task_id in search_ids("search=okapi&status=cancelled")
+        assert task_id not in search_ids("search=okapi&status=pending")
+        assert task_id not in search_ids("search=reportgather")
+
+        client.put(f"/api/tasks/{task_id}", json={"title": "Quarterly Review"})
+        assert task_id not in search_ids("search=zebra")
+
+    def test_get_tasks_gzip(self, client, sample_task):
+        """Test large task lists are gzip-compressed"""
+        for _ in range(5):
+            client.post("/api/tasks", json=sample_task)
+        response = client.get("/api/tasks", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json()["count"] >= 5
+
+    def test_get_tasks_repeated_query_sees_changes(self, client, sample_task):
+        """Test repeated identical queries reflect later mutations"""
+        query = "/api/tasks?status=cancelled&search=repeat"
+        assert client.get(query).json() == client.get(query).json()
+
+        create_response = client.post("/api/tasks", json={
+            "title": "Repeat Poll", "status": "cancelled"
+        })
+        task_id = create_response.json()["data"]["id"]
+        assert task_id in [t["id"] for t in client.get(query).json()["data"]]
+
+        client.put(f"/api/tasks/{task_id}", json={"title": "Renamed"})
+        assert task_id not in [t["id"] for t in client.get(query).json()["data"]]
+
     def test_get_tasks_pagination(self, client):
         """Test pagination"""
         response = client.get("/api/tasks?limit=1&offset=0")
@@ -112,6 +211,15 @@ class TestGetTasks:
         assert data["success"] is True
         assert data["data"]["id"] == "task-001"
 
+    def test_get_task_datetime_format(self, client):
+        """Test datetime fields are serialized as ISO 8601 strings"""
+        response = client.get("/api/tasks/task-003")
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["due_date"] == "2025-01-25T17:00:00"
+        assert data["created_at"] == "2025-01-13T08:00:00"
+        assert data["updated_at"] == "2025-01-13T08:00:00"
+
     def test_get_task_not_found(self, client):
         """Test 404 for non-existent task"""
         response = client.get("/api/tasks/non-existent-id")
@@ -146,6 +254,33 @@ class TestCreateTask:
         assert data["data"]["status"] == "pending"  # Default
         assert data["data"]["priority"] == "medium"  # Default
 
+    def test_create_task_repeated_random_id(self, client, sample_task, monkeypatch):
+        """Test a random ID that is already taken is skipped"""
+        import app.main as main
+        existing = client.post("/api/tasks", json=sample_task).json()["data"]["id"]
+        repeat = bytes.fromhex(existing[len("task-"):])
+        # Next pool bytes: the taken ID twice, then a free one
+        monkeypatch.setattr(main, "_id_pool", bytearray(repeat * 2 + b"\x01" * 4))
+        monkeypatch.setattr(main, "_id_pool_pos", 0)
+
+        response = client.post("/api/tasks", json=sample_task)
+        assert response.status_code == 201
+        assert response.json()["data"]["id"] == "task-01010101"
+        assert client.get(f"/api/tasks/{existing}").status_code == 200
+
+    def test_task_table_rejects_existing_id(self, client):
+        """Test a second row for the same task ID is refused"""
+        import app.main as main
+        before = client.get("/api/stats").json()
+        with pytest.raises(ValueError):
+            main.task_table.append(main.tasks_db["task-001"], 0, 0)
+
+        after = client.get("/api/stats").json()
+        assert after == before
+        assert sum(after["by_status"].values()) == after["total_tasks"]
+        ids = [t["id"] for t in client.get("/api/tasks").json()["data"]]
+        assert len(ids) == len(set(ids))
+
     def test_create_task_empty_title(self, client):
         """Test validation error for empty title"""
         response = client.post("/api/tasks", json={"title": ""})
@@ -172,6 +307,34 @@ class TestCreateTask:
         })
         assert response.status_code == 422
 
+    def test_create_tasks_bulk(self, client):
+        """Test creating several tasks in one request"""
+        response = client.post("/api/tasks/bulk", json=[
+            {"title": "Bulk One"},
+            {"title": "Bulk Two", "status": "completed", "priority": "high"}
+        ])
+        assert response.status_code == 201
+        data = response.json()
+        assert data["success"] is True
+        assert data["count"] == 2
+        second = client.get(f"/api/tasks/{data['ids'][1]}").json()["data"]
+        assert second["title"] == "Bulk Two"
+        assert second["status"] == "completed"
+
+    def test_create_tasks_bulk_invalid_item(self, client):
+        """Test one invalid task rejects the whole batch"""
+        before = client.get("/api/stats").json()["total_tasks"]
+        response = client.post("/api/tasks/bulk", json=[
+            {"title": "Valid"},
+            {"title": ""}
+        ])
+        assert response.status_code == 422
+        assert client.get("/api/stats").json()["total_tasks"] == before
+
+    def test_create_tasks_bulk_empty(self, client):
+        """Test validation error for an empty batch"""
+        response = client.post("/api/tasks/bulk", json=[])
+        assert response.status_code == 422
 
 
 # UPDATE TASK TESTS
@@ -204,6 +367,45 @@ class TestUpdateTask:
         assert data["data"]["title"] == "Updated Title"
         assert data["data"]["priority"] == "urgent"
 
+    def test_update_task_moves_between_filters(self, client):
+        """Test status/priority filters reflect updated values"""
+        create_response = client.post("/api/tasks", json={
+            "title": "Filter Move Task",
+            "status": "cancelled",
+            "priority": "low"
+        })
+        task_id = create_response.json()["data"]["id"]
+
+        response = client.get("/api/tasks?status=cancelled&priority=low")
+        assert task_id in [t["id"] for t in response.json()["data"]]
+
+        client.put(f"/api/tasks/{task_id}", json={"status": "completed"})
+
+        response = client.get("/api/tasks?status=cancelled&priority=low")
+        assert task_id not in [t["id"] for t in response.json()["data"]]
+        response = client.get("/api/tasks?status=completed&priority=low")
+        assert task_id in [t["id"] for t in response.json()["data"]]
+
+        client.delete(f"/api/tasks/{task_id}")
+
+        response = client.get("/api/tasks?status=completed")
+        assert task_id not in [t["id"] for t in response.json()["data"]]
+
+    def test_update_task_null_required_field(self, client, sample_task):
+        """Test explicit null does not clear a required field"""
+        create_response = client.post("/api/tasks", json=sample_task)
+        task_id = create_response.json()["data"]["id"]
+
+        response = client.put(
+            f"/api/tasks/{task_id}",
+            json={"title": None, "status": None, "description": None}
+        )
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["title"] == sample_task["title"]
+        assert data["status"] == sample_task["status"]
+        assert data["description"] is None
+
     def test_update_task_not_found(self, client):
         """Test 404 when updating non-existent task"""
         response = client.put(
@@ -236,6 +438,19 @@ class TestDeleteTask:
         get_response = client.get(f"/api/tasks/{task_id}")
         assert get_response.status_code == 404
 
+    def test_delete_task_keeps_list_order(self, client, sample_task):
+        """Test paginated listing stays in order after a delete"""
+        for _ in range(3):
+            client.post("/api/tasks", json=sample_task)
+        before = [t["id"] for t in client.get("/api/tasks").json()["data"]]
+
+        client.delete(f"/api/tasks/{before[1]}")
+
+        after = [t["id"] for t in client.get("/api/tasks").json()["data"]]
+        assert after[:len(before) - 1] == before[:1] + before[2:]
+        page = client.get("/api/tasks?limit=2&offset=1").json()["data"]
+        assert [t["id"] for t in page] == after[1:3]
+
     def test_delete_task_not_found(self, client):
         """Test 404 when deleting non-existent task"""
         response = client.delete("/api/tasks/fake-id")
@@ -258,4 +473,27 @@ class TestStatistics:
         assert "by_priority" in data
         assert isinstance(data["total_tasks"], int)
 
+    def test_statistics_track_mutations(self, client):
+        """Test statistics counts follow create/update/delete"""
+        before = client.get("/api/stats").json()
+        assert sum(before["by_status"].values()) == before["total_tasks"]
+        assert sum(before["by_priority"].values()) == before["total_tasks"]
 
+        create_response = client.post("/api/tasks", json={
+            "title": "Stats Task",
+            "status": "cancelled",
+            "priority": "urgent"
+        })
+        task_id = create_response.json()["data"]["id"]
+        after_create = client.get("/api/stats").json()
+        assert after_create["total_tasks"] == before["total_tasks"] + 1
+        assert after_create["by_status"]["cancelled"] == before["by_status"]["cancelled"] + 1
+        assert after_create["by_priority"]["urgent"] == before["by_priority"]["urgent"] + 1
+
+        client.put(f"/api/tasks/{task_id}", json={"status": "pending"})
+        after_update = client.get("/api/stats").json()
+        assert after_update["by_status"]["cancelled"] == before["by_status"]["cancelled"]
+        assert after_update["by_status"]["pending"] == before["by_status"]["pending"] + 1
+
+        client.delete(f"/api/tasks/{task_id}")
+        assert client.get("/api/stats").json() == before